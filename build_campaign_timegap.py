@@ -11,17 +11,36 @@ It keeps the existing MAILZIP-first logic and (optionally) time filters.
 
 Everything else remains identical to the previous version.
 """
-import os, sys, csv, re, argparse, datetime, random, collections
-from typing import List, Dict, Tuple, Optional
+import os, sys, csv, re, argparse, datetime, random, collections, time, heapq, pickle, hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, NamedTuple, Callable, Iterable, Iterator, Set
 
 TRACKER_DIR = "MasterCampaignTracker"
 TRACKER_FILE = os.path.join(TRACKER_DIR, "MasterPropertyCampaignTracker.csv")
+# Parsed tracker cached in a per-user folder (never in the shared tracker folder, which stays
+# read-only here); reused only while the CSV's mtime and size are unchanged
+TRACKER_CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "mailmonkey")
+# Bump when tracker parsing changes (how counts/dates are read); the key format and
+# TrackerEntry's fields are part of the cache tag already, see _tracker_cache_tag
+TRACKER_CACHE_VERSION = 1
+
+_ZIP5_TAIL_RE = re.compile(r"(\d{5})(?:-\d{4})?$")
+_CAMPAIGN_SPLIT_RE = re.compile(r"[|,]\s*")
 
 def norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # split()/join collapses the same whitespace set as re's \s+
+    return " ".join((s or "").split())
 
-def norm_key(addr: str, owner: str) -> Tuple[str, str]:
-    return (norm_space(addr).upper(), norm_space(owner).upper())
+def _key_from_norm(addr_n: str, owner: str) -> str:
+    # The one definition of the dedupe/tracker key; ingest calls it directly to reuse its normalized address.
+    # Key format: "ADDR\x1fOWNER"
+    return addr_n.upper() + "\x1f" + norm_space(owner).upper()
+
+def norm_key(addr: str, owner: str) -> str:
+    return _key_from_norm(norm_space(addr), owner)
 
 # ---------------- Name casing ----------------
 ENTITY_UPPER = {"LLC","L.L.C.","LP","L.P.","LLP","L.L.P.","INC","INC.","CORP","CORP.","CO","CO.","PC","P.C.","PLLC","P.L.L.C.","LTD","LTD.","DBA","D.B.A.","POA","P.O.A."}
@@ -70,70 +89,88 @@ def smart_name_case(name: str) -> str:
         parts.append(_cap_segment(tok))
     return " ".join(parts)
 
+@lru_cache(maxsize=1 << 16)
 def get_zip5_from_text(s: str) -> str:
+    # ZIP column values repeat heavily across rows, so results are memoized per distinct string
     if not s:
         return ""
     s = str(s).strip()
-    s = re.sub(r"\.0$", "", s)  # handle 95835.0
-    m = re.search(r"(\d{5})(?:-\d{4})?$", s)
-    return m.group(1) if m else ""
-
-def get_zip5_from_row(row: Dict[str,str], addr: str) -> str:
-    # MAILING/OWNER first
-    mail_zip_cols = [
-        "Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE",
-        "MAIL ZIP5","Mail ZIP5","MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5",
-        "Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5"
-    ]
-    for c in mail_zip_cols:
-        if c in row and str(row[c]).strip():
-            z = get_zip5_from_text(row[c]); 
-            if z: return z
-
-    mail_addr_cols = [
-        "MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
-        "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address"
-    ]
-    for c in mail_addr_cols:
-        if c in row and str(row[c]).strip():
-            z = get_zip5_from_text(row[c]); 
-            if z: return z
-
-    # Generic
-    for c in ["ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5"]:
-        if c in row and str(row[c]).strip():
-            z = get_zip5_from_text(row[c]); 
-            if z: return z
-
-    # Situs last
-    for c in [
-        "SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5",
-        "Situs ZIP","Situs Zip Code"
-    ]:
-        if c in row and str(row[c]).strip():
-            z = get_zip5_from_text(row[c]); 
-            if z: return z
-
-    z = get_zip5_from_text(addr)  # last resort
-    return z or ""
-
-def read_csv_rows(path: str) -> List[Dict[str,str]]:
-    with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        return [{k:(v or "").strip() for k,v in row.items()} for row in r]
-
-def read_csv_rows_headers(path: str) -> Tuple[List[Dict[str,str]], List[str]]:
-    with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        rows = [{k:(v or "").strip() for k,v in row.items()} for row in r]
-        headers = r.fieldnames or []
-        return rows, headers
-
-def write_csv(path: str, rows: List[Dict[str,str]], headers: List[str]):
+    if s.endswith(".0"):
+        s = s[:-2]  # handle 95835.0
+    m = _ZIP5_TAIL_RE.search(s)
+    # Few distinct ZIP5s across many rows: share one object per value
+    return sys.intern(m.group(1)) if m else ""
+
+# ---------------- Source column candidates (in precedence order) ----------------
+MAIL_ZIP_COLS = (
+    "Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE",
+    "MAIL ZIP5","Mail ZIP5","MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5",
+    "Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5"
+)
+MAIL_ADDR_COLS = (
+    "MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
+    "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address"
+)
+GENERIC_ZIP_COLS = ("ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5")
+SITUS_ZIP_COLS = (
+    "SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5",
+    "Situs ZIP","Situs Zip Code"
+)
+ADDR_COLS = (
+    "PropertyAddress","PROPERTY ADDRESS","PROPERTY_ADDRESS",
+    "SITUS ADDRESS","SITUS_ADDRESS","SITUS",
+    "MAILING ADDRESS","MAILING_ADDRESS",
+    "ADDRESS","ADDRESS 1","ADDRESS1","STREET ADDRESS",
+    "Situs Address","Mailing Address","Property Address"
+)
+OWNER_COLS = (
+    "OwnerName","OWNER NAME","OWNER","OWNER(S)","OWNER 1","OWNER1","OWNER NAME 1",
+    "Primary Name","PRIMARY NAME","Mail Owner","OWNER NAME(S)"
+)
+OWNER_NAME_PAIRS = (
+    ("Primary First","Primary Last"),
+    ("PRIMARY FIRST","PRIMARY LAST"),
+    ("Owner First","Owner Last"),
+    ("OWNER FIRST","OWNER LAST"),
+    ("First Name","Last Name"),
+    ("FIRST NAME","LAST NAME"),
+)
+
+def resolve_zip5_columns(headers: List[str]) -> Callable[[Dict[str,str], str], str]:
+    """Return a ZIP5 extractor bound to the ZIP columns present in one file's header.
+
+    Precedence is unchanged: mailing/owner ZIP, mailing address, generic ZIP,
+    situs ZIP, then the detected address as a last resort.
+    """
+    present = set(headers)
+    cols = tuple(c for c in MAIL_ZIP_COLS + MAIL_ADDR_COLS + GENERIC_ZIP_COLS + SITUS_ZIP_COLS if c in present)
+
+    def extract(row: Dict[str,str], addr: str) -> str:
+        for c in cols:
+            v = row[c]
+            if v:
+                z = get_zip5_from_text(v)
+                if z: return z
+        return get_zip5_from_text(addr)  # last resort
+
+    return extract
+
+def _iter_records(r, headers: List[str]) -> Iterator[Dict[str,str]]:
+    # Rows as dicts with stripped values; short rows padded, blank lines skipped
+    n = len(headers)
+    for rec in r:
+        if not rec:
+            continue  # blank line (DictReader skips these too)
+        if len(rec) < n:
+            rec += [""] * (n - len(rec))
+        yield dict(zip(headers, [v.strip() for v in rec]))
+
+def write_csv_rows(path: str, rows: Iterable[list], headers: List[str]):
+    """Write rows that are already lists in header order (no per-field dict lookups); rows may be a generator."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
+    with open(path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(headers)
         w.writerows(rows)
 
 def campaign_folder(campaign_name: str, campaign_number: int, when: Optional[datetime.date]=None) -> str:
@@ -152,21 +189,87 @@ def try_parse_date(s: str) -> Optional[datetime.date]:
             continue
     return None
 
-# ---------------- Tracker (READ-ONLY) ----------------
-def read_tracker() -> Dict[Tuple[str,str], Dict[str,str]]:
-    d: Dict[Tuple[str,str], Dict[str,str]] = {}
+# ---------------- Tracker (READ-ONLY; a parsed copy is cached under TRACKER_CACHE_DIR) ----------------
+class TrackerEntry(NamedTuple):
+    """Prior-send facts for one address/owner, parsed once when the tracker is loaded."""
+    count: int
+    last_campaign: int
+    last_sent: Optional[datetime.date]
+
+def _tracker_cache_path() -> str:
+    # One cache per tracker location, so separate working folders never share entries
+    tag = hashlib.sha1(os.path.abspath(TRACKER_FILE).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(TRACKER_CACHE_DIR, f"tracker-{tag}.pickle")
+
+def _tracker_cache_tag() -> tuple:
+    # A cache written under a different key format or entry layout is never reused
+    return (TRACKER_CACHE_VERSION, TrackerEntry._fields, norm_key(" 1  Main St ", " Doe, Jane "))
+
+def _load_tracker_cache(stamp: Tuple[int, int], with_dates: bool) -> Optional[Dict[str, TrackerEntry]]:
+    try:
+        with open(_tracker_cache_path(), "rb") as f:
+            tag, cached_stamp, cached_dates, d = pickle.load(f)
+        if tag != _tracker_cache_tag() or cached_stamp != stamp or (with_dates and not cached_dates):
+            return None
+        return {k: TrackerEntry._make(v) for k, v in d.items()}
+    except Exception:
+        return None  # missing, stale format or unreadable: fall back to parsing the CSV
+
+def _save_tracker_cache(stamp: Tuple[int, int], with_dates: bool, d: Dict[str, TrackerEntry]):
+    path = _tracker_cache_path()
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(TRACKER_CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            # Plain tuples: a TrackerEntry pickled from the script would be __main__.TrackerEntry,
+            # which no importing caller can load back
+            pickle.dump((_tracker_cache_tag(), stamp, with_dates, {k: tuple(v) for k, v in d.items()}),
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        # The cache is only an accelerator: never fail the build over it, and leave no partial file
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def read_tracker(with_dates: bool = True) -> Dict[str, TrackerEntry]:
+    d: Dict[str, TrackerEntry] = {}
     if not os.path.exists(TRACKER_FILE):
         return d
-    rows = read_csv_rows(TRACKER_FILE)
-    for r in rows:
-        k = norm_key(r.get("PropertyAddress",""), r.get("OwnerName",""))
-        d[k] = r
+    st = os.stat(TRACKER_FILE)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _load_tracker_cache(stamp, with_dates)
+    if cached is not None:
+        return cached
+    # Single pass: rows go straight into the keyed dict, no intermediate row list
+    with open(TRACKER_FILE, "r", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        r = csv.reader(f)
+        headers = [sys.intern(h) for h in next(r, [])]
+        for row in _iter_records(r, headers):
+            try:
+                cnt = int((row.get("CampaignCount") or "0").strip() or 0)
+            except Exception:
+                cnt = 0
+            last_cn = 0
+            nums = (row.get("CampaignNumbers","") or "").strip()
+            if nums:
+                for p in reversed(_CAMPAIGN_SPLIT_RE.split(nums)):
+                    try:
+                        last_cn = int(p)
+                        break
+                    except Exception:
+                        pass
+            # Date parsing is the costly part, so skip it when no time filter will read it
+            last_dt = parse_last_sent_date(row) if with_dates else None
+            d[norm_key(row.get("PropertyAddress",""), row.get("OwnerName",""))] = TrackerEntry(cnt, last_cn, last_dt)
+    _save_tracker_cache(stamp, with_dates, d)
     return d
 
 def parse_last_campaign_number(info: Dict[str,str]) -> int:
     nums = (info.get("CampaignNumbers","") or "").strip()
     if nums:
-        parts = re.split(r"[|,]\s*", nums)
+        parts = _CAMPAIGN_SPLIT_RE.split(nums)
         ints = []
         for p in parts:
             try:
@@ -180,48 +283,50 @@ def parse_last_campaign_number(info: Dict[str,str]) -> int:
     except Exception:
         return 0
 
-def detect_addr_owner_from_source_row(row: Dict[str,str]) -> Tuple[str,str]:
+class SourceColumns(NamedTuple):
+    """Address/owner candidate columns actually present in one source file."""
+    addr: Tuple[str, ...]
+    addr_fallback: Optional[str]
+    owner: Tuple[str, ...]
+    owner_pairs: Tuple[Tuple[str,str], ...]
+    owner_fallback: Optional[str]
+
+def resolve_source_columns(headers: List[str]) -> SourceColumns:
+    present = set(headers)
+    lmap = {h.lower():h for h in headers}
+    return SourceColumns(
+        addr=tuple(c for c in ADDR_COLS if c in present),
+        addr_fallback=lmap.get("address"),
+        owner=tuple(c for c in OWNER_COLS if c in present),
+        owner_pairs=tuple((f, l) for f, l in OWNER_NAME_PAIRS if f in present or l in present),
+        owner_fallback=lmap.get("owner"),
+    )
+
+def detect_addr_owner_from_source_row(row: Dict[str,str], cols: Optional[SourceColumns] = None) -> Tuple[str,str]:
+    if cols is None:
+        cols = resolve_source_columns(list(row))
+    # _iter_records already strips every value, so no per-field strip here.
     addr = ""
-    lmap = {k.lower():k for k in row}
-    addr_candidates = [
-        "PropertyAddress","PROPERTY ADDRESS","PROPERTY_ADDRESS",
-        "SITUS ADDRESS","SITUS_ADDRESS","SITUS",
-        "MAILING ADDRESS","MAILING_ADDRESS",
-        "ADDRESS","ADDRESS 1","ADDRESS1","STREET ADDRESS",
-        "Situs Address","Mailing Address","Property Address"
-    ]
-    for c in addr_candidates:
-        if c in row and row[c].strip():
-            addr = row[c].strip(); break
-    if not addr and "address" in lmap:
-        addr = row[lmap["address"]]
+    for c in cols.addr:
+        addr = row[c]
+        if addr: break
+    if not addr and cols.addr_fallback:
+        addr = row[cols.addr_fallback]
 
     own = ""
-    owner_candidates = [
-        "OwnerName","OWNER NAME","OWNER","OWNER(S)","OWNER 1","OWNER1","OWNER NAME 1",
-        "Primary Name","PRIMARY NAME","Mail Owner","OWNER NAME(S)"
-    ]
-    for c in owner_candidates:
-        if c in row and row[c].strip():
-            own = row[c].strip(); break
+    for c in cols.owner:
+        own = row[c]
+        if own: break
 
     if not own:
-        for fkey, lkey in (
-            ("Primary First","Primary Last"),
-            ("PRIMARY FIRST","PRIMARY LAST"),
-            ("Owner First","Owner Last"),
-            ("OWNER FIRST","OWNER LAST"),
-            ("First Name","Last Name"),
-            ("FIRST NAME","LAST NAME"),
-        ):
-            f = (row.get(fkey,"") or "").strip()
-            l = (row.get(lkey,"") or "").strip()
+        for fkey, lkey in cols.owner_pairs:
+            f = row.get(fkey, ""); l = row.get(lkey, "")
             if f or l:
-                own = norm_space(f"{f} {l}")
+                own = f"{f} {l}" if f and l else (f or l)
                 break
 
-    if not own and "owner" in lmap:
-        own = row[lmap["owner"]].strip()
+    if not own and cols.owner_fallback:
+        own = row[cols.owner_fallback]
 
     return addr, own
 
@@ -230,58 +335,92 @@ def detect_addr_owner_from_selected_row(row: Dict[str,str]) -> Tuple[str,str]:
     own  = row.get("OwnerName") or row.get("OWNER NAME") or row.get("Primary Name") or row.get("PRIMARY NAME") or ""
     return addr, own
 
-def pick_optimized(candidates: List[Dict[str,str]], target: int, strict_150: bool) -> List[Dict[str,str]]:
+class Cand:
+    """One selectable row: a slotted record instead of a per-candidate dict."""
+    __slots__ = ("addr", "owner", "zip5", "src", "headers")
+    # Master column name -> attribute, for template columns the source row lacks
+    COLUMNS = {"PropertyAddress": "addr", "OwnerName": "owner", "ZIP5": "zip5"}
+
+    def __init__(self, addr: str, owner: str, zip5: str, src: Dict[str,str], headers: List[str]):
+        self.addr = addr
+        self.owner = owner
+        self.zip5 = zip5
+        self.src = src
+        self.headers = headers  # the source file's header list, shared by all of its rows
+
+def partial_shuffle(seq: list, k: int, rng: random.Random, start: int = 0) -> None:
+    """Fisher-Yates over k slots only: seq[start:start+k] becomes a uniform random sample of seq[start:], in O(k)."""
+    n = len(seq)
+    for i in range(start, min(start + k, n - 1)):
+        j = rng.randrange(i, n)
+        seq[i], seq[j] = seq[j], seq[i]
+
+def _largest_first(items: list, key: Callable, k: int) -> Iterator:
+    """Yield items in sorted(items, key=key, reverse=True) order. The picker usually stops after a
+    few buckets, so only the top k are selected up front; the full sort runs only if more are consumed."""
+    if k < len(items):
+        yield from heapq.nlargest(k, items, key=key)  # documented equal to the sorted(...)[:k] prefix
+        yield from sorted(items, key=key, reverse=True)[k:]
+    else:
+        yield from sorted(items, key=key, reverse=True)
+
+def _fill(chosen: List[Cand], buckets: Iterable[Tuple[List[Cand], int]], target: int, rng: random.Random) -> None:
+    """Top chosen up to target with random rows from each (bucket, start) in turn; only bucket[start:] is
+    drawn from, shuffled in place rather than copied."""
+    for bucket, start in buckets:
+        need = target - len(chosen)
+        if need <= 0: break
+        partial_shuffle(bucket, need, rng, start)
+        chosen.extend(bucket[start:start + need])
+
+def pick_optimized(by_zip5: Dict[str, List[Cand]], target: int, strict_150: bool,
+                   rng: Optional[random.Random] = None, sizes: Optional[Dict[str,int]] = None) -> List[Cand]:
+    """Pick up to target rows from candidates already grouped by ZIP5 (buckets are shuffled in place).
+
+    `sizes` gives each ZIP5's true row count when the buckets are capped samples of it; buckets are
+    ranked by it so two capped buckets keep the order their full sizes would give them.
+    """
     if target <= 0: return []
-    by_zip5: Dict[str, List[Dict[str,str]]] = collections.defaultdict(list)
-    for r in candidates:
-        by_zip5[r.get("ZIP5","")].append(r)
+    if rng is None: rng = random.Random()
+    size_of = (lambda kv: sizes.get(kv[0], len(kv[1]))) if sizes else (lambda kv: len(kv[1]))
 
-    buckets = sorted(by_zip5.items(), key=lambda kv: (len(kv[1]), kv[0] != ""), reverse=True)
+    # Largest first, blank ZIP5 last among equal sizes
+    top_k = max(1, target // 100)  # buckets the first passes typically consume before reaching target
+    buckets = _largest_first(list(by_zip5.items()), lambda kv: (size_of(kv), kv[0] != ""), top_k)
 
-    chosen: List[Dict[str,str]] = []
+    chosen: List[Cand] = []
     if strict_150:
+        taken: Dict[str, int] = {}  # per-ZIP5 cursor: rows [0, taken) went to full trays
         for z5, bucket in buckets:
             if len(chosen) >= target: break
-            random.shuffle(bucket)
+            if len(bucket) < 150: break  # sorted by size, so no later bucket fills a tray either
             take_n = (len(bucket) // 150) * 150
             if take_n == 0: continue
-            chosen.extend(bucket[:min(take_n, target - len(chosen))])
-            by_zip5[z5] = bucket[min(take_n, len(bucket)):]
+            take = min(take_n, target - len(chosen))
+            partial_shuffle(bucket, take, rng)
+            chosen.extend(bucket[:take])
+            taken[z5] = take_n
 
         if len(chosen) < target:
-            leftovers = sorted(by_zip5.items(), key=lambda kv: len(kv[1]), reverse=True)
-            for z5, bucket in leftovers:
-                if len(chosen) >= target: break
-                random.shuffle(bucket)
-                for row in bucket:
-                    if len(chosen) >= target: break
-                    chosen.append(row)
+            leftovers = _largest_first(list(by_zip5.items()), lambda kv: len(kv[1]) - taken.get(kv[0], 0), top_k)
+            _fill(chosen, ((bucket, taken.get(z5, 0)) for z5, bucket in leftovers), target, rng)
     else:
-        for z5, bucket in buckets:
-            if len(chosen) >= target: break
-            random.shuffle(bucket)
-            for row in bucket:
-                if len(chosen) >= target: break
-                chosen.append(row)
+        _fill(chosen, ((bucket, 0) for _, bucket in buckets), target, rng)
 
     if len(chosen) < target:
-        remaining = [r for r in candidates if r not in chosen]
-        by_zip3: Dict[str, List[Dict[str,str]]] = collections.defaultdict(list)
-        for r in remaining:
-            z3 = (r.get("ZIP5","") or "")[:3]
-            by_zip3[z3].append(r)
-        zip3_buckets = sorted(by_zip3.items(), key=lambda kv: len(kv[1]), reverse=True)
-        for z3, bucket in zip3_buckets:
-            if len(chosen) >= target: break
-            random.shuffle(bucket)
-            for row in bucket:
-                if len(chosen) >= target: break
-                chosen.append(row)
+        chosen_ids = {id(r) for r in chosen}
+        # Regroup the unchosen rows by ZIP3 straight from the ZIP5 buckets (no remaining list)
+        by_zip3: Dict[str, List[Cand]] = collections.defaultdict(list)
+        for z5, bucket in by_zip5.items():
+            rest = [r for r in bucket if id(r) not in chosen_ids]
+            if rest:
+                by_zip3[z5[:3]].extend(rest)
+        _fill(chosen, ((b, 0) for b in _largest_first(list(by_zip3.values()), len, top_k)), target, rng)
 
     return chosen[:target]
 
-def estimate_postage(chosen: List[Dict[str,str]], rate_5: float, rate_3: float, rate_aadc: float) -> Dict[str, float]:
-    by_zip5 = collections.Counter(r.get("ZIP5","") for r in chosen)
+def estimate_postage(by_zip5: Dict[str,int], rate_5: float, rate_3: float, rate_aadc: float) -> Dict[str, float]:
+    """Tray-based postage estimate from per-ZIP5 piece counts (blank ZIP5 keyed as "")."""
     five_digit = 0
     leftovers_by_zip3 = collections.Counter()
     for z5, c in by_zip5.items():
@@ -297,7 +436,7 @@ def estimate_postage(chosen: List[Dict[str,str]], rate_5: float, rate_3: float,
         three_digit += trays * 150
         aadc += total - trays * 150
 
-    total_pieces = len(chosen)
+    total_pieces = sum(by_zip5.values())
     cost_5 = five_digit * rate_5
     cost_3 = three_digit * rate_3
     cost_a = aadc * rate_aadc
@@ -332,12 +471,12 @@ def parse_last_sent_date(info: Dict[str,str]) -> Optional[datetime.date]:
     return try_parse_date(info.get("FirstSentDt",""))
 
 def passes_prior_rules(
-    k: Tuple[str,str], tracker: Dict[Tuple[str,str],Dict[str,str]],
+    k: str, tracker: Dict[str, TrackerEntry],
     prior_exact: Optional[int], prior_max: Optional[int], min_gap: int, current_campaign_number: int,
     min_days_since_last: Optional[int], last_sent_before: Optional[datetime.date], missing_last_policy: str
 ) -> bool:
     info = tracker.get(k)
-    if not info:
+    if info is None:
         if prior_exact is not None and prior_exact != 0:
             return False
         if prior_max is not None and 0 > prior_max:
@@ -346,44 +485,88 @@ def passes_prior_rules(
             return (missing_last_policy == "include")
         return True
 
-    try:
-        cnt = int((info.get("CampaignCount") or "0").strip() or 0)
-    except Exception:
-        cnt = 0
-    nums = (info.get("CampaignNumbers","") or "").strip()
-    last_cn = 0
-    if nums:
-        parts = re.split(r"[|,]\s*", nums)
-        ints = []
-        for p in parts:
-            try:
-                ints.append(int(p))
-            except Exception:
-                pass
-        if ints:
-            last_cn = ints[-1]
-
+    cnt, last_cn, last_dt = info
     if prior_exact is not None and cnt != prior_exact:
         return False
     if prior_max is not None and cnt > prior_max:
         return False
-    if min_gap > 0 and last_cn > 0:
-        if last_cn > (current_campaign_number - min_gap):
-            return False
+    if min_gap > 0 and last_cn > (current_campaign_number - min_gap) and last_cn > 0:
+        return False
 
     if (min_days_since_last is not None) or (last_sent_before is not None):
-        last_dt = parse_last_sent_date(info)
         if not last_dt:
             return (missing_last_policy == "include")
-        today = datetime.date.today()
         if min_days_since_last is not None:
-            if (today - last_dt).days < min_days_since_last:
+            if (datetime.date.today() - last_dt).days < min_days_since_last:
                 return False
         if last_sent_before is not None:
             if not (last_dt < last_sent_before):
                 return False
     return True
 
+class PriorVerdicts(NamedTuple):
+    """passes_prior_rules evaluated once per tracker key, so each row needs a single set lookup."""
+    missing_passes: bool  # verdict for keys absent from the tracker
+    flipped: Set[str]     # tracker keys whose verdict differs from missing_passes
+
+    def passes(self, k: str) -> bool:
+        return (k in self.flipped) != self.missing_passes
+
+def build_prior_verdicts(tracker: Dict[str, TrackerEntry], prior: tuple) -> PriorVerdicts:
+    # `prior` is the argument tail of passes_prior_rules; the rules are fixed for the run.
+    missing_passes = passes_prior_rules("", {}, *prior)
+    return PriorVerdicts(missing_passes,
+                         {k for k in tracker if passes_prior_rules(k, tracker, *prior) != missing_passes})
+
+class SourceFile(NamedTuple):
+    """Result of filtering one input file; `kept` rows are (key, addr, owner, zip5, row) in file order."""
+    headers: List[str]
+    n_rows: int
+    kept: List[Tuple[str, str, str, str, Dict[str,str]]]
+    missing_addr: int
+    missing_owner: int
+    dropped_prior: int
+
+def filter_source_file(path: str, prior: Optional[PriorVerdicts]) -> SourceFile:
+    """Parse one input and apply the per-row checks that don't depend on other files.
+
+    `prior` is None when no prior/time filter is set (every row passes). Dedupe is left to the caller:
+    the prior verdict depends only on the key, so filtering first doesn't change which
+    occurrence of a key is kept.
+    """
+    kept = []; n_rows = missing_addr = missing_owner = dropped_prior = 0
+    # Streamed: rows that fail a check are never held, only the kept ones survive the file
+    with open(path, "r", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        rdr = csv.reader(f)
+        # Interned so row lookups by the column-name constants hit on identity
+        headers = [sys.intern(h) for h in next(rdr, [])]
+        cols = resolve_source_columns(headers)
+        zip5_of = resolve_zip5_columns(headers)
+        # Hot loop: module-level helpers bound to locals once per file
+        detect = detect_addr_owner_from_source_row; ns = norm_space; key_of = _key_from_norm
+        passes = prior.passes if prior is not None else None; keep = kept.append
+        for r in _iter_records(rdr, headers):
+            n_rows += 1
+            addr, own = detect(r, cols)
+            if not addr: missing_addr += 1; continue
+            if not own:  missing_owner += 1; continue
+            addr_n = ns(addr)
+            k = key_of(addr_n, own)
+            if passes is not None and not passes(k):
+                dropped_prior += 1; continue
+            keep((k, addr_n, own, zip5_of(r, addr), r))
+    return SourceFile(headers, n_rows, kept, missing_addr, missing_owner, dropped_prior)
+
+# Worker-process state for --workers > 1 (verdicts are computed once in the parent and shipped to each worker)
+_WORKER_PRIOR: Optional[PriorVerdicts] = None
+
+def _init_worker(prior: Optional[PriorVerdicts]):
+    global _WORKER_PRIOR
+    _WORKER_PRIOR = prior
+
+def _filter_source_file_worker(path: str) -> SourceFile:
+    return filter_source_file(path, _WORKER_PRIOR)
+
 def main():
     ap = argparse.ArgumentParser(description="Build USPS-optimized campaign master list (MAILZIP-first) with OwnerName case normalization + optional time filters.")
     ap.add_argument("--campaign-name", required=True)
@@ -405,7 +588,9 @@ def main():
     ap.add_argument("--rate-5digit", type=float, default=0.244)
     ap.add_argument("--rate-3digit", type=float, default=0.275)
     ap.add_argument("--rate-aadc", type=float, default=0.330)
+    ap.add_argument("--seed", type=int, default=None, help="Seed the random selection so runs are repeatable")
 
+    ap.add_argument("--workers", type=int, default=1, help="Parse input files in this many processes (default 1)")
     ap.add_argument("--debug", action="store_true")
 
     args = ap.parse_args()
@@ -422,155 +607,174 @@ def main():
             except Exception:
                 pass
 
-    tracker = read_tracker()
-
+    # Wall time per phase, reported with --debug so tuning starts from where the time actually goes
+    t_start = time.perf_counter()
+    prior: Optional[PriorVerdicts] = None
+    # With no prior/time filter every row passes, so the tracker is never loaded
+    if (args.prior_exact is not None or args.prior_max is not None or args.min_gap > 0
+            or args.min_days_since_last is not None or last_before_dt is not None):
+        tracker = read_tracker(with_dates=args.min_days_since_last is not None or last_before_dt is not None)
+        prior = build_prior_verdicts(tracker, (args.prior_exact, args.prior_max, args.min_gap, args.campaign_number,
+                                               args.min_days_since_last, last_before_dt, args.missing_last_sent))
+        del tracker  # only the verdict set is needed from here on
+
+    rng = random.Random(args.seed)
     seen_keys = set()
-    all_candidates: List[Dict[str,str]] = []
+    # Per-ZIP5 reservoirs (Algorithm R). Capacity is the target rounded up to a full
+    # 150-piece tray, so the strict-150 tray math sees the same take for any bucket
+    # that would overflow it; smaller buckets are kept whole.
+    reservoir_cap = -(-max(args.target_size, 0) // 150) * 150
+    reservoirs: Dict[str, List[Cand]] = collections.defaultdict(list)
+    zip_seen: Dict[str, int] = collections.defaultdict(int)
 
     stats = {"MAND":{"kept":0,"deduped":0,"dropped_prior":0,"missing_addr":0,"missing_owner":0},
              "POOL":{"kept":0,"deduped":0,"dropped_prior":0,"missing_addr":0,"missing_owner":0}}
 
-    def process_rows(rows: List[Dict[str,str]], bucket: str):
-        for r in rows:
-            addr, own = detect_addr_owner_from_source_row(r)
-            if not addr: stats[bucket]["missing_addr"] += 1; continue
-            if not own:  stats[bucket]["missing_owner"] += 1; continue
-            k = norm_key(addr, own)
-            if k in seen_keys: stats[bucket]["deduped"] += 1; continue
-
-            if not passes_prior_rules(
-                k, tracker, args.prior_exact, args.prior_max, args.min_gap, args.campaign_number,
-                args.min_days_since_last, last_before_dt, args.missing_last_sent
-            ):
-                stats[bucket]["dropped_prior"] += 1; continue
-
-            z5 = get_zip5_from_row(r, addr)
-            owner_disp = smart_name_case(own)
-            row = {"PropertyAddress": norm_space(addr), "OwnerName": owner_disp, "ZIP5": z5, "_src_row": r}
-            all_candidates.append(row)
-            seen_keys.add(k); stats[bucket]["kept"] += 1
-
-    for p in args.mandatory:
-        rows = read_csv_rows(p)
-        if args.debug: print(f"[DEBUG] Reading mandatory: {p} (rows={len(rows)})")
-        process_rows(rows, "MAND")
-
-    mand_kept = stats["MAND"]["kept"]
-    if mand_kept > args.target_size:
-        print(f"[ERROR] Mandatory lists exceed target after filtering ({mand_kept} > {args.target_size}). Refine inputs."); sys.exit(1)
-
-    for p in args.optional:
-        rows = read_csv_rows(p)
-        if args.debug: print(f"[DEBUG] Reading optional: {p} (rows={len(rows)})")
-        process_rows(rows, "POOL")
+    def merge_source(src: SourceFile, bucket: str):
+        st = stats[bucket]
+        st["missing_addr"] += src.missing_addr
+        st["missing_owner"] += src.missing_owner
+        st["dropped_prior"] += src.dropped_prior
+        hdrs = src.headers
+        # Per-row counters stay local and are flushed into stats once per file
+        kept = deduped = 0
+        seen_add = seen_keys.add; randrange = rng.randrange; cap = reservoir_cap
+        for k, addr, own, z5, r in src.kept:
+            if k in seen_keys: deduped += 1; continue
+            seen_add(k); kept += 1
+            # owner stays raw here; display casing is applied to the chosen rows only.
+            res = reservoirs[z5]; n = zip_seen[z5]; zip_seen[z5] = n + 1
+            if len(res) < cap:
+                res.append(Cand(addr, own, z5, r, hdrs))
+            else:
+                j = randrange(n + 1)
+                if j < cap: res[j] = Cand(addr, own, z5, r, hdrs)
+        st["kept"] += kept; st["deduped"] += deduped
+
+    inputs = args.mandatory + args.optional
+    workers = min(args.workers, len(inputs), os.cpu_count() or 1)
+    # Each file is merged as soon as it is parsed and its kept rows are then dropped, so at most one
+    # file's candidates are alive beside the reservoirs; optional files are never merged (or, serially,
+    # never parsed) once the mandatory ones already exceed the target.
+    source_headers: Dict[str, List[str]] = {}
+    ex = None
+    if workers > 1:
+        # Files are independent until dedupe, so each is parsed and filtered in its own process.
+        ex = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(prior,))
+        sources: Iterable[SourceFile] = ex.map(_filter_source_file_worker, inputs)
+    else:
+        sources = (filter_source_file(p, prior) for p in inputs)
+    try:
+        for i, (p, src) in enumerate(zip(inputs, sources)):
+            mandatory = i < len(args.mandatory)
+            if args.debug: print(f"[DEBUG] Reading {'mandatory' if mandatory else 'optional'}: {p} (rows={src.n_rows})")
+            source_headers[p] = src.headers
+            merge_source(src, "MAND" if mandatory else "POOL")
+            del src
+            if i == len(args.mandatory) - 1:
+                mand_kept = stats["MAND"]["kept"]
+                if mand_kept > args.target_size:
+                    print(f"[ERROR] Mandatory lists exceed target after filtering ({mand_kept} > {args.target_size}). Refine inputs."); sys.exit(1)
+    finally:
+        if ex is not None:
+            ex.shutdown(cancel_futures=True)
 
     if args.debug:
         kept_m = stats["MAND"]["kept"]; kept_p = stats["POOL"]["kept"]
         print("[DEBUG] Summary after ingest:")
         print(f"  MAND kept={kept_m}  deduped={stats['MAND']['deduped']}  dropped_prior={stats['MAND']['dropped_prior']}  missing_addr={stats['MAND']['missing_addr']}  missing_owner={stats['MAND']['missing_owner']}")
         print(f"  POOL kept={kept_p}  deduped={stats['POOL']['deduped']}  dropped_prior={stats['POOL']['dropped_prior']}  missing_addr={stats['POOL']['missing_addr']}  missing_owner={stats['POOL']['missing_owner']}")
-        print(f"  TOTAL candidates={len(all_candidates)}")
-
-    chosen = pick_optimized(all_candidates, args.target_size, args.strict_150)
-    chosen.sort(key=lambda r: ((r.get("ZIP5") or "ZZZZZ"), r.get("PropertyAddress",""), r.get("OwnerName","")))
-
-    by_zip5 = collections.Counter((r.get("ZIP5","") or "(none)") for r in chosen)
-    presort_rows = [{"ZIP5": z5, "Count": c} for z5, c in by_zip5.most_common()]
-    by_zip3 = collections.Counter(((z5 if z5!="(none)" else "")[:3]) for z5 in by_zip5.keys())
-    presort_rows3 = []
-    for z3 in sorted(by_zip3.keys()):
-        if z3 is None: z3 = ""
-        total = sum(by_zip5[z5] for z5 in by_zip5 if (z5 if z5!="(none)" else "")[:3] == z3)
-        est_zip5_buckets = sum(1 for z5 in by_zip5 if (z5 if z5!="(none)" else "")[:3] == z3)
-        presort_rows3.append({"ZIP3": z3 or "(none)", "EstZIP5Buckets": est_zip5_buckets, "TotalPieces": total})
+        print(f"  TOTAL candidates={kept_m + kept_p}")
+
+    t_merged = time.perf_counter()
+    # The reservoirs are already the per-ZIP5 buckets the picker works on; zip_seen ranks them by true size
+    chosen = pick_optimized(reservoirs, args.target_size, args.strict_150, rng, zip_seen)
+    for r in chosen:
+        r.owner = smart_name_case(r.owner)
+    chosen.sort(key=lambda r: ((r.zip5 or "ZZZZZ"), r.addr, r.owner))
+
+    # One ZIP5 count feeds the presort reports and the postage estimate
+    by_zip5 = collections.Counter(r.zip5 for r in chosen)
+    presort_rows = [[z5 or "(none)", c] for z5, c in by_zip5.most_common()]
+    z3_totals = collections.Counter(); z3_buckets = collections.Counter()
+    for z5, c in by_zip5.items():
+        z3 = z5[:3]
+        z3_totals[z3] += c; z3_buckets[z3] += 1
+    presort_rows3 = [[z3 or "(none)", z3_buckets[z3], z3_totals[z3]] for z3 in sorted(z3_totals)]
 
+    t_picked = time.perf_counter()
     camp_dir = campaign_folder(args.campaign_name, args.campaign_number)
     master_path = os.path.join(camp_dir, "campaign_master.csv")
     presort_path = os.path.join(camp_dir, "presort_report.csv")
     presort_zip3_path = os.path.join(camp_dir, "presort_zip3_summary.csv")
     postage_path = os.path.join(camp_dir, "postage_estimate.csv")
 
-    write_csv(presort_path, presort_rows, ["ZIP5","Count"])
-    write_csv(presort_zip3_path, presort_rows3, ["ZIP3","EstZIP5Buckets","TotalPieces"])
+    write_csv_rows(presort_path, presort_rows, ["ZIP5","Count"])
+    write_csv_rows(presort_zip3_path, presort_rows3, ["ZIP3","EstZIP5Buckets","TotalPieces"])
 
-    est = estimate_postage(chosen, args.rate_5digit, args.rate_3digit, args.rate_aadc)
+    est = estimate_postage(by_zip5, args.rate_5digit, args.rate_3digit, args.rate_aadc)
     postage_rows = [
-        {"Tier":"5digit","Pieces":est["five_digit"],"Rate":args.rate_5digit,"Cost":round(est["cost_5"],2)},
-        {"Tier":"3digit","Pieces":est["three_digit"],"Rate":args.rate_3digit,"Cost":round(est["cost_3"],2)},
-        {"Tier":"AADC","Pieces":est["aadc"],"Rate":args.rate_aadc,"Cost":round(est["cost_a"],2)},
-        {"Tier":"total","Pieces":len(chosen),"Rate":"","Cost":round(est["total_cost"],2)},
-        {"Tier":"AveragePerPiece","Pieces":"","Rate":"","Cost":round(est["avg"],4)},
+        ["5digit", est["five_digit"], args.rate_5digit, round(est["cost_5"],2)],
+        ["3digit", est["three_digit"], args.rate_3digit, round(est["cost_3"],2)],
+        ["AADC", est["aadc"], args.rate_aadc, round(est["cost_a"],2)],
+        ["total", len(chosen), "", round(est["total_cost"],2)],
+        ["AveragePerPiece", "", "", round(est["avg"],4)],
     ]
-    write_csv(postage_path, postage_rows, ["Tier","Pieces","Rate","Cost"])
+    write_csv_rows(postage_path, postage_rows, ["Tier","Pieces","Rate","Cost"])
 
     template_headers: List[str] = []
     header_source_path = None
-    for p in args.mandatory:
-        try:
-            _, hdrs = read_csv_rows_headers(p)
-            if hdrs:
-                template_headers = hdrs; header_source_path = p; break
-        except Exception:
-            continue
-    if not template_headers:
-        for p in args.optional:
-            try:
-                _, hdrs = read_csv_rows_headers(p)
-                if hdrs:
-                    template_headers = hdrs; header_source_path = p; break
-            except Exception:
-                continue
+    for p in (args.mandatory + args.optional):
+        hdrs = source_headers[p]
+        if hdrs:
+            template_headers = hdrs; header_source_path = p; break
     use_minimal = False
     if not template_headers:
         use_minimal = True
         template_headers = ["Address","Primary Name"]
 
-    index: Dict[Tuple[str,str], Dict[str,str]] = {}
-    for p in (args.mandatory + args.optional):
-        try:
-            rows = read_csv_rows(p)
-        except Exception:
-            continue
-        for r in rows:
-            a, o = detect_addr_owner_from_source_row(r)
-            if not a or not o: continue
-            k = norm_key(a, o)
-            if k not in index:
-                index[k] = r
-
-    out_rows: List[Dict[str,str]] = []
-    missing = 0
-    for sel in chosen:
-        a = sel.get("PropertyAddress",""); o = sel.get("OwnerName",""); k = norm_key(a, o)
-        src = index.get(k) or sel.get("_src_row", {})
-        if not src:
-            missing += 1; src = {}
-
-        new_row = {}
-        if use_minimal:
-            new_row = {"Address": a, "Primary Name": smart_name_case(o)}
-        else:
-            for col in template_headers:
-                if col in src:
-                    val = src.get(col, "")
-                elif col in sel:
-                    val = sel.get(col, "")
-                else:
-                    val = ""
-                if col.strip().lower() in {"ownername","owner name","primary name","primary_name","mail owner","owner","owner(s)"}:
-                    val = smart_name_case(val or o)
-                new_row[col] = val
-
-            for addr_like in ("Address","ADDRESS","Property Address","PROPERTY ADDRESS","Situs Address","SITUS ADDRESS","Mailing Address","MAILING ADDRESS"):
-                if addr_like in new_row and not new_row[addr_like].strip():
-                    new_row[addr_like] = a
-            for owner_like in ("Primary Name","PRIMARY NAME","OwnerName","OWNER NAME","OWNER","OWNER(S)"):
-                if owner_like in new_row and not new_row[owner_like].strip():
-                    new_row[owner_like] = smart_name_case(o)
-
-        out_rows.append(new_row)
-
-    write_csv(master_path, out_rows, template_headers)
+    owner_idx = [i for i, col in enumerate(template_headers)
+                 if col.strip().lower() in {"ownername","owner name","primary name","primary_name","mail owner","owner","owner(s)"}]
+    addr_fill_idx = [i for i, col in enumerate(template_headers)
+                     if col in ("Address","ADDRESS","Property Address","PROPERTY ADDRESS","Situs Address","SITUS ADDRESS","Mailing Address","MAILING ADDRESS")]
+    owner_fill_idx = [i for i, col in enumerate(template_headers)
+                      if col in ("Primary Name","PRIMARY NAME","OwnerName","OWNER NAME","OWNER","OWNER(S)")]
+
+    # (source column, None) when the file has it, else (None, Cand attribute or None for blank).
+    col_plans: Dict[int, List[Tuple[Optional[str], Optional[str]]]] = {}
+    def col_plan(hdrs: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+        plan = col_plans.get(id(hdrs))
+        if plan is None:
+            present = set(hdrs)
+            plan = col_plans[id(hdrs)] = [(col, None) if col in present else (None, Cand.COLUMNS.get(col))
+                                          for col in template_headers]
+        return plan
+
+    def master_rows() -> Iterator[List[str]]:
+        # Streamed straight into the writer; the output rows are never held as a list
+        for sel in chosen:
+            a = sel.addr; o = sel.owner
+            src = sel.src  # every candidate carries the exact source row it came from
+
+            if use_minimal:
+                yield [a, smart_name_case(o)]
+                continue
+
+            vals = [src[col] if col is not None else (getattr(sel, attr) if attr else "")
+                    for col, attr in col_plan(sel.headers)]
+            for i in owner_idx:
+                vals[i] = smart_name_case(vals[i] or o)
+            for i in addr_fill_idx:
+                if not vals[i].strip():
+                    vals[i] = a
+            for i in owner_fill_idx:
+                if not vals[i].strip():
+                    vals[i] = smart_name_case(o)
+
+            yield vals
+
+    write_csv_rows(master_path, master_rows(), template_headers)
+    t_written = time.perf_counter()
 
     print(f"[OK] Created campaign folder: {camp_dir}")
     print(f"[OK] Master list: {master_path}  (rows={len(chosen)})")
@@ -579,8 +783,10 @@ def main():
     print(f"[OK] Postage estimate: {postage_path}")
     if header_source_path:
         print(f"[INFO] Master schema mirrored from: {header_source_path}")
-    if missing and args.debug:
-        print(f"[DEBUG] {missing} rows had no exact (addr,owner) source match; backfilled from selection.")
+    if args.debug:
+        print(f"[DEBUG] Timing: parse+filter+dedupe={t_merged - t_start:.2f}s  "
+              f"pick+presort={t_picked - t_merged:.2f}s  write={t_written - t_picked:.2f}s  "
+              f"(workers={workers})")
 
 if __name__ == "__main__":
     main()
@@ -30,23 +30,40 @@ from typing import Dict, List, Tuple, Optional
 # ------------------------------ Helpers ------------------------------
 
 def norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # Same whitespace collapse as the builder's norm_space
+    return " ".join((s or "").split())
 
-def norm_key(addr: str, owner: str) -> Tuple[str, str]:
-    return (norm_space(addr).upper(), norm_space(owner).upper())
+def norm_key(addr: str, owner: str) -> str:
+    # Single string key ("ADDR\x1fOWNER"), same shape as the campaign builder's tracker key
+    return norm_space(addr).upper() + "\x1f" + norm_space(owner).upper()
 
 def read_csv(path: str) -> List[Dict[str, str]]:
-    with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        return [{k:(v or "").strip() for k,v in row.items()} for row in r]
+    # Same reading rules as the builder's _iter_records: stripped values, short rows padded
+    with open(path, "r", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        r = csv.reader(f)
+        headers = next(r, [])
+        n = len(headers)
+        rows: List[Dict[str, str]] = []
+        for rec in r:
+            if not rec:
+                continue  # blank line
+            if len(rec) < n:
+                rec += [""] * (n - len(rec))
+            rows.append(dict(zip(headers, [v.strip() for v in rec])))
+        return rows
 
 def write_csv(path: str, rows: List[Dict[str,str]], headers: List[str]):
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
-        for row in rows:
-            w.writerow(row)
+    with open(path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        hset = set(headers)
+        def values(r: Dict[str,str]) -> List[str]:
+            # Same contract as DictWriter: missing fields are blank, unknown fields are an error
+            if not hset.issuperset(r):
+                raise ValueError("dict contains fields not in fieldnames: " + ", ".join(repr(k) for k in r if k not in hset))
+            return [r.get(h, "") for h in headers]
+        w = csv.writer(f)
+        w.writerow(headers)
+        w.writerows(map(values, rows))
 
 def try_parse_date(s: str) -> Optional[datetime]:
     s = (s or "").strip()
@@ -78,9 +95,13 @@ def find_file(*candidates: str) -> Optional[str]:
             return p
     return None
 
+_CAMPAIGN_DIR_RE = re.compile(r"^(?P<name>.+?)_(?P<num>\d+)_")
+_ZIP5_TAIL_RE = re.compile(r"(\d{5})(?:-\d{4})?$")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
 def infer_campaign_from_dir(campaign_dir: str) -> Tuple[str, Optional[str]]:
     base = os.path.basename(os.path.normpath(campaign_dir))
-    m = re.match(r"^(?P<name>.+?)_(?P<num>\d+)_", base)
+    m = _CAMPAIGN_DIR_RE.match(base)
     if m:
         return m.group("name"), m.group("num")
     return base, None
@@ -88,78 +109,62 @@ def infer_campaign_from_dir(campaign_dir: str) -> Tuple[str, Optional[str]]:
 # ---------------- ZIP helpers (MAIL-FIRST) ----------------
 def _zip_from_text(s: str) -> str:
     if not s: return ""
-    m = re.search(r"(\d{5})(?:-\d{4})?$", str(s).strip())
+    m = _ZIP5_TAIL_RE.search(str(s).strip())
     return m.group(1) if m else ""
 
-def get_zip_from_row_generic(r: Dict[str,str]) -> str:
-    # 1) Mailing/Owner ZIPs
-    for k in ("Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE","MAIL ZIP5","Mail ZIP5",
-              "MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5","Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5"):
-        if k in r and r[k].strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # 2) Mailing/Owner address strings
-    for k in ("MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
-              "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address"):
-        if k in r and r[k].strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # 3) Generic ZIPs
-    for k in ("ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5"):
-        if k in r and r[k].strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # 4) Situs/Property (last)
-    for k in ("SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5","Situs ZIP","Situs Zip Code"):
+# Generators' MAIL-FIRST ZIP order (see generate_letters.ROW_ZIP_COLS); property address strings last
+ROW_ZIP_COLS = (
+    "Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE","MAIL ZIP5","Mail ZIP5",
+    "MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5","Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5",
+    "MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
+    "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address",
+    "ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5",
+    "SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5","Situs ZIP","Situs Zip Code",
+    "property_address","Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS",
+)
+MASTER_ADDR_COLS = ("Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS")
+MASTER_OWNER_COLS = ("Primary Name","PRIMARY NAME","OwnerName","OWNER NAME","Owner","OWNER")
+MASTER_FIRST_COLS = ("Primary First","PRIMARY FIRST","Owner First","OWNER FIRST","First Name","FIRST NAME")
+MASTER_LAST_COLS = ("Primary Last","PRIMARY LAST","Owner Last","OWNER LAST","Last Name","LAST NAME")
+
+def _first_value(r: Dict[str,str], cols) -> str:
+    for k in cols:
         if k in r and r[k].strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    for k in ("property_address","Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS"):
+            return r[k]
+    return ""
+
+def _first_zip(r: Dict[str,str], cols) -> str:
+    for k in cols:
         if k in r and r[k].strip():
             z = _zip_from_text(r[k])
             if z: return z
     return ""
 
-def build_zip_index_from_master(campaign_dir: str) -> Dict[Tuple[str,str], str]:
-    """Build (addr_norm, owner_norm) -> ZIP5 from campaign_master.csv, MAIL-FIRST."""
-    idx: Dict[Tuple[str,str], str] = {}
+def get_zip_from_row_generic(r: Dict[str,str]) -> str:
+    return _first_zip(r, ROW_ZIP_COLS)
+
+def build_zip_index_from_master(campaign_dir: str) -> Dict[str, str]:
+    """Build norm_key(addr, owner) -> ZIP5 from campaign_master.csv, MAIL-FIRST."""
+    idx: Dict[str, str] = {}
     cm_path = os.path.join(campaign_dir, "campaign_master.csv")
     if not os.path.isfile(cm_path):
         return idx
     rows = read_csv(cm_path)
+    if not rows:
+        return idx
 
-    def get_zip_from_row(r: Dict[str,str]) -> str:
-        z = get_zip_from_row_generic(r)
-        if z: return z
-        # As last resort, property fields
-        for k in ("Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS"):
-            if k in r and r[k].strip():
-                z = _zip_from_text(r[k]); 
-                if z: return z
-        return ""
-
-    def get_addr(r: Dict[str,str]) -> str:
-        for key in ("Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS"):
-            if key in r and r[key].strip():
-                return r[key]
-        return ""
-
-    def get_owner(r: Dict[str,str]) -> str:
-        for key in ("Primary Name","PRIMARY NAME","OwnerName","OWNER NAME","Owner","OWNER"):
-            if key in r and r[key].strip():
-                return r[key]
-        # fallback compose
-        f = ""; l = ""
-        for fk in ("Primary First","PRIMARY FIRST","Owner First","OWNER FIRST","First Name","FIRST NAME"):
-            if fk in r and r[fk].strip(): f = r[fk]; break
-        for lk in ("Primary Last","PRIMARY LAST","Owner Last","OWNER LAST","Last Name","LAST NAME"):
-            if lk in r and r[lk].strip(): l = r[lk]; break
-        return (f + " " + l).strip()
+    present = set(rows[0])
+    zip_cols = tuple(k for k in ROW_ZIP_COLS + MASTER_ADDR_COLS if k in present)  # property fields as last resort
+    addr_cols = tuple(k for k in MASTER_ADDR_COLS if k in present)
+    owner_cols = tuple(k for k in MASTER_OWNER_COLS if k in present)
+    first_cols = tuple(k for k in MASTER_FIRST_COLS if k in present)
+    last_cols = tuple(k for k in MASTER_LAST_COLS if k in present)
 
     for r in rows:
-        z = get_zip_from_row(r)
-        a = get_addr(r)
-        o = get_owner(r)
+        z = _first_zip(r, zip_cols)
+        a = _first_value(r, addr_cols)
+        # fallback compose first + last when no full owner name
+        o = _first_value(r, owner_cols) or (_first_value(r, first_cols) + " " + _first_value(r, last_cols)).strip()
         if a and o and z:
             idx[norm_key(a,o)] = z
     return idx
@@ -189,7 +194,7 @@ def append_executed_and_update_tracker(args) -> None:
         print(f"[ERROR] Mapping file has no rows: {mapping_path}")
         return
 
-    zip_idx = build_zip_index_from_master(campaign_dir)
+    zip_idx: Optional[Dict[str, str]] = None  # built on first row that needs it
 
     executed_log = os.path.join(campaign_dir, "executed_campaign_log.csv")
     existing_log = read_csv(executed_log) if os.path.isfile(executed_log) else []
@@ -212,10 +217,13 @@ def append_executed_and_update_tracker(args) -> None:
         refc  = r.get("ref_code","") or r.get("RefCode","")
         templ = r.get("template_ref","") or r.get("template_id","") or r.get("TemplateId","") or r.get("Template","")
         z5    = r.get("ZIP5","") or get_zip_from_row_generic(r)
+        pair = norm_key(addr, owner)
         if not z5 and (addr and owner):
-            z5 = zip_idx.get(norm_key(addr, owner), "")
+            if zip_idx is None:
+                zip_idx = build_zip_index_from_master(campaign_dir)
+            z5 = zip_idx.get(pair, "")
 
-        key = (norm_key(addr, owner), str(campaign_number).strip())
+        key = (pair, str(campaign_number).strip())
 
         if not args.force_recount:
             if key in exist_pair_campaign or (refc and refc in exist_ref):
@@ -252,9 +260,9 @@ def append_executed_and_update_tracker(args) -> None:
     tracker_path = args.tracker_path
     os.makedirs(os.path.dirname(tracker_path), exist_ok=True)
     tracker_rows = read_csv(tracker_path) if os.path.isfile(tracker_path) else []
-    idx: Dict[Tuple[str,str], Dict[str,str]] = { norm_key(r.get("PropertyAddress",""), r.get("OwnerName","")): r for r in tracker_rows }
+    idx: Dict[str, Dict[str,str]] = { norm_key(r.get("PropertyAddress",""), r.get("OwnerName","")): r for r in tracker_rows }
 
-    by_pair_new: Dict[Tuple[str,str], List[Dict[str,str]]] = {}
+    by_pair_new: Dict[str, List[Dict[str,str]]] = {}
     for r in to_add:
         k = norm_key(r["PropertyAddress"], r["OwnerName"])
         by_pair_new.setdefault(k, []).append(r)
@@ -275,7 +283,7 @@ def append_executed_and_update_tracker(args) -> None:
             cn_set = set(existing_cns)
             for rr in rows:
                 cn_set.add(rr["CampaignNumber"])
-            tr["CampaignNumbers"] = "|".join(sorted(cn_set, key=lambda x: int(re.sub(r"[^0-9]", "", x) or "0")))
+            tr["CampaignNumbers"] = "|".join(sorted(cn_set, key=lambda x: int(_NON_DIGIT_RE.sub("", x) or "0")))
             tr["CampaignCount"]   = str(len(cn_set))
             # templates (sequence, allow duplicates)
             existing_ts = [x for x in (tr.get("TemplateIds","") or "").split("|") if x]
@@ -300,7 +308,7 @@ def append_executed_and_update_tracker(args) -> None:
                 "CampaignCount": str(len(cn_set)),
                 "FirstSentDt": today_str,
                 "LastSentDt": today_str,
-                "CampaignNumbers": "|".join(sorted(cn_set, key=lambda x: int(re.sub(r"[^0-9]", "", x) or "0"))),
+                "CampaignNumbers": "|".join(sorted(cn_set, key=lambda x: int(_NON_DIGIT_RE.sub("", x) or "0"))),
                 "TemplateIds": "|".join(ts_seq),
             }
 
@@ -368,10 +376,10 @@ def rebuild_tracker_from_all(args) -> None:
 
     print(f"[INFO] Found {len(folders)} campaign folders.")
     # Aggregate data across all logs
-    agg: Dict[Tuple[str,str], Dict[str,object]] = {}
+    agg: Dict[str, Dict[str,object]] = {}
     for folder in folders:
-        # prepare ZIP index from that folder's campaign_master for backfill
-        zip_idx = build_zip_index_from_master(folder)
+        # ZIP index from that folder's campaign_master, only parsed if a row needs backfill
+        zip_idx: Optional[Dict[str, str]] = None
         log_path = os.path.join(folder, "executed_campaign_log.csv")
         try:
             rows = read_csv(log_path)
@@ -386,11 +394,15 @@ def rebuild_tracker_from_all(args) -> None:
             z5 = (r.get("ZIP5","") or "").strip()
             if not z5:
                 # Try to backfill from mapping row (if present) or master index
-                z5 = get_zip_from_row_generic(r) or (zip_idx.get(key, ""))
+                z5 = get_zip_from_row_generic(r)
+                if not z5:
+                    if zip_idx is None:
+                        zip_idx = build_zip_index_from_master(folder)
+                    z5 = zip_idx.get(key, "")
 
             cn_raw = (r.get("CampaignNumber","") or "").strip()
             try:
-                cn = int(re.sub(r"[^0-9]", "", cn_raw) or "0")
+                cn = int(_NON_DIGIT_RE.sub("", cn_raw) or "0")
             except Exception:
                 cn = 0
             dt = try_parse_date(r.get("ExecutedDt","")) or None
@@ -24,6 +24,7 @@ Default output:
 import argparse
 import csv
 import os
+import re
 from pathlib import Path
 
 from reportlab.pdfgen import canvas
@@ -225,41 +226,34 @@ def default_out_path(csv_path: Path) -> Path:
 
 # -------------- ZIP helpers (mailing-first) --------------
 
+_ZIP5_TAIL_RE = re.compile(r"(\d{5})(?:-\d{4})?$")
+
 def _zip_from_text(s: str) -> str:
     if not s:
         return ""
     s = str(s).strip()
     if s.endswith(".0"):
         s = s[:-2]
-    import re
-    m = re.search(r"(\d{5})(?:-\d{4})?$", s)
+    m = _ZIP5_TAIL_RE.search(s)
     return m.group(1) if m else ""
 
-def get_zip_from_row_generic(r: dict) -> str:
-    # 1) Mailing/Owner ZIPs
-    for k in ("Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE","MAIL ZIP5","Mail ZIP5",
-              "MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5","Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # 2) Mailing/Owner address strings
-    for k in ("MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
-              "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # 3) Generic ZIPs
-    for k in ("ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # 4) Situs/Property (last)
-    for k in ("SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5","Situs ZIP","Situs Zip Code"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k])
-            if z: return z
-    # parse from address fields
-    for k in ("property_address","Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS"):
+# Same MAIL-FIRST ZIP precedence as generate_letters.py; keep the two in sync
+ROW_ZIP_COLS = (
+    "Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE","MAIL ZIP5","Mail ZIP5",
+    "MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5","Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5",
+    "MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
+    "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address",
+    "ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5",
+    "SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5","Situs ZIP","Situs Zip Code",
+    "property_address","Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS",
+)
+
+def resolve_zip_columns(headers) -> tuple:
+    present = set(headers)
+    return tuple(k for k in ROW_ZIP_COLS if k in present)
+
+def get_zip_from_row_generic(r: dict, cols: tuple = ROW_ZIP_COLS) -> str:
+    for k in cols:
         if k in r and str(r[k]).strip():
             z = _zip_from_text(r[k])
             if z: return z
@@ -471,13 +465,15 @@ def main():
     with csv_path.open(newline="", encoding="utf-8-sig") as f:
         rdr = csv.DictReader(f)
         all_rows = [row for row in rdr]
+        fieldnames = rdr.fieldnames or []
 
     # Apply limit (only affects actual envelopes; separators are derived from these rows)
     if args.limit and args.limit > 0:
         all_rows = all_rows[:args.limit]
 
     # Pre-compute ZIP5 list (mailing-first)
-    zips = [get_zip_from_row_generic(r) or "" for r in all_rows]
+    zip_cols = resolve_zip_columns(fieldnames)
+    zips = [get_zip_from_row_generic(r, zip_cols) or "" for r in all_rows]
 
     # If enabled, compute bins (1-based indices into all_rows)
     bins = []
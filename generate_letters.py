@@ -112,8 +112,10 @@ POSSIBLE_ADDRESS     = [
     "situsaddr","situs","situsaddress","property situs","prop address","situs_address"
 ]
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
 def _norm(s: str) -> str:
-    return re.sub(r"[^a-z0-9]+", " ", (s or "").strip().lower())
+    return _NON_ALNUM_RE.sub(" ", (s or "").strip().lower())
 
 def find_column(headers: List[str], candidates: List[str]) -> Optional[str]:
     norm_map = {h: _norm(h) for h in headers}
@@ -132,17 +134,19 @@ def find_column(headers: List[str], candidates: List[str]) -> Optional[str]:
     return None
 
 LLC_TOKENS = r"(ET\s+AL|TRUST|LLC|INC|CO|LP|L\.P\.|LTD)"
+_ENTITY_RE = re.compile(r"\b" + LLC_TOKENS + r"\b\.?,?", re.I)
 def clean_entity_tokens(name: str) -> str:
-    return re.sub(r"\b" + LLC_TOKENS + r"\b\.?,?", "", name or "", flags=re.I).strip()
+    return _ENTITY_RE.sub("", name or "").strip()
+
+_ORDINAL_RE = re.compile(r"^(\d+)(st|nd|rd|th)$")
 
 def to_title_case(s: str) -> str:
     if not s:
         return s
     s = s.strip().lower()
     out = []
-    m_ord = re.compile(r"^(\d+)(st|nd|rd|th)$")
     for w in s.split():
-        m = m_ord.match(w)
+        m = _ORDINAL_RE.match(w)
         out.append(m.group(1)+m.group(2) if m else w.capitalize())
     return " ".join(out)
 
@@ -174,23 +178,26 @@ STREET_TYPE_WORDS = {
     "trl","trail","sq","square"
 }
 
+_UNIT_RE = re.compile(r"\b(apt|unit|#)\s*\w+", re.I)
+_HOUSE_NUMBER_RE = re.compile(r"^\d+[a-zA-Z]?$")
+
 def extract_street_name(full_address: str) -> str:
     if not full_address:
         return "your street"
     s = full_address.strip()
     first_seg = s.split(",")[0]
-    first_seg = re.sub(r"\b(apt|unit|#)\s*\w+", "", first_seg, flags=re.I).strip()
+    first_seg = _UNIT_RE.sub("", first_seg).strip()
     tokens = first_seg.split()
     if not tokens:
         return "your street"
     i = 0
-    while i < len(tokens) and re.match(r"^\d+[a-zA-Z]?$", tokens[i]):
+    while i < len(tokens) and _HOUSE_NUMBER_RE.match(tokens[i]):
         i += 1
     street_tokens = tokens[i:] or tokens
-    lower = [t.lower().strip(".") for t in street_tokens]
+    # Normalize tokens only until the first street-type word (no lowered copy of the whole list)
     end_idx = None
-    for idx, tok in enumerate(lower):
-        if tok in STREET_TYPE_WORDS:
+    for idx, tok in enumerate(street_tokens):
+        if tok.lower().strip(".") in STREET_TYPE_WORDS:
             end_idx = idx
             break
     core = " ".join(street_tokens[:end_idx+1]) if end_idx is not None else " ".join(street_tokens)
@@ -219,11 +226,18 @@ def is_trust_case(row) -> bool:
     primary_name    = _first_nonempty_from_row(row, ["Primary Name","PRIMARY NAME","primary name","primary_name"])
     return (not (primary_first or primary_last or secondary_name or secondary_first or secondary_last)) and bool(primary_name)
 
-def personalize_letter(row: Dict[str, str], your_name: str, your_phone: str, your_email: str, template_text: str) -> Tuple[str, str, str, str]:
-    headers = list(row.keys())
-    col_first = find_column(headers, POSSIBLE_OWNER_FIRST)
-    col_name  = find_column(headers, POSSIBLE_OWNER_NAME)
-    col_addr  = find_column(headers, POSSIBLE_ADDRESS)
+_DEAR_LINE_RE = re.compile(r"^Dear\s*\{OwnerFirstName\},\s*\n+", re.M)
+
+def resolve_letter_columns(headers) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(owner first, owner name, address) columns of a CSV header."""
+    headers = list(headers)
+    return (find_column(headers, POSSIBLE_OWNER_FIRST),
+            find_column(headers, POSSIBLE_OWNER_NAME),
+            find_column(headers, POSSIBLE_ADDRESS))
+
+def personalize_letter(row: Dict[str, str], your_name: str, your_phone: str, your_email: str, template_text: str,
+                       cols: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None) -> Tuple[str, str, str, str]:
+    col_first, col_name, col_addr = cols if cols is not None else resolve_letter_columns(row.keys())
 
     # Determine first-name for "Dear ..."
     owner_first_raw = split_owner_first(row.get(col_first or "", ""), row.get(col_name or "", ""))
@@ -244,7 +258,7 @@ def personalize_letter(row: Dict[str, str], your_name: str, your_phone: str, you
 
     # Compose content based on salutation rule
     if trust:
-        adjusted = re.sub(r"^Dear\s*\{OwnerFirstName\},\s*\n+", "{SalutationLine}\n\n", template_text, flags=re.M)
+        adjusted = _DEAR_LINE_RE.sub("{SalutationLine}\n\n", template_text)
         content = adjusted.format(
             SalutationLine=f"{owner_display or to_title_case(owner_full_raw) or 'Owner'},",
             OwnerFirstName=owner_first or owner_display,  # keep available if used elsewhere
@@ -263,7 +277,7 @@ def personalize_letter(row: Dict[str, str], your_name: str, your_phone: str, you
         )
     else:
         display = owner_display or owner_full_raw or "Owner"
-        adjusted = re.sub(r"^Dear\s*\{OwnerFirstName\},\s*\n+", "{SalutationLine}\n\n", template_text, flags=re.M)
+        adjusted = _DEAR_LINE_RE.sub("{SalutationLine}\n\n", template_text)
         content = adjusted.format(
             SalutationLine=f"{display},",
             OwnerFirstName="",  # not used in this path
@@ -279,41 +293,38 @@ def personalize_letter(row: Dict[str, str], your_name: str, your_phone: str, you
 
 # ---------------- ZIP helpers (Mailing-first) ----------------
 
+_ZIP5_TAIL_RE = re.compile(r"(\d{5})(?:-\d{4})?$")
+
 def _zip_from_text(s: str) -> str:
     if not s:
         return ""
     s = str(s).strip()
-    s = re.sub(r"\.0$", "", s)  # handle 95835.0
-    m = re.search(r"(\d{5})(?:-\d{4})?$", s)
+    if s.endswith(".0"):
+        s = s[:-2]  # handle 95835.0
+    m = _ZIP5_TAIL_RE.search(s)
     return m.group(1) if m else ""
 
-def get_zip_from_row_generic(r: Dict[str,str]) -> str:
-    # 1) Mailing/Owner ZIPs
-    for k in ("Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE","MAIL ZIP5","Mail ZIP5",
-              "MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5","Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k]); 
-            if z: return z
-    # 2) Mailing/Owner address strings
-    for k in ("MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
-              "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k]); 
-            if z: return z
-    # 3) Generic ZIPs
-    for k in ("ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k]); 
-            if z: return z
-    # 4) Situs/Property (last)
-    for k in ("SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5","Situs ZIP","Situs Zip Code"):
-        if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k]); 
-            if z: return z
-    # parse from address fields
-    for k in ("property_address","Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS"):
+# MAIL-FIRST precedence: mailing/owner ZIPs, mailing/owner address strings,
+# generic ZIPs, situs ZIPs, then ZIPs parsed from property address fields
+ROW_ZIP_COLS = (
+    "Mail ZIP","MAIL ZIP","Mail Zip","Mail Zip Code","MAIL ZIP CODE","MAIL ZIP5","Mail ZIP5",
+    "MAILING ZIP","MAILING ZIP CODE","MAILING ZIP5","Owner ZIP","OWNER ZIP","Owner Zip","OWNER ZIP5","Owner ZIP5",
+    "MAILING ADDRESS","Mailing Address","Mailing Address 1","Mailing Address1",
+    "OWNER ADDRESS","Owner Address","OWNER MAILING ADDRESS","Owner Mailing Address",
+    "ZIP5","Zip5","ZIP","Zip","Zip Code","ZIP CODE","ZIP CODE 5",
+    "SITUS ZIP","SITUS ZIP CODE","SITUS ZIP CODE 5-DIGIT","SITUS ZIP5","Situs ZIP","Situs Zip Code",
+    "property_address","Property Address","PROPERTY ADDRESS","Address","ADDRESS","Situs Address","SITUS ADDRESS","PropertyAddress","SITUS",
+)
+
+def resolve_zip_columns(headers) -> tuple:
+    """ZIP candidate columns present in a CSV header, in precedence order (resolve once per file)."""
+    present = set(headers)
+    return tuple(k for k in ROW_ZIP_COLS if k in present)
+
+def get_zip_from_row_generic(r: Dict[str,str], cols: tuple = ROW_ZIP_COLS) -> str:
+    for k in cols:
         if k in r and str(r[k]).strip():
-            z = _zip_from_text(r[k]); 
+            z = _zip_from_text(r[k])
             if z: return z
     return ""
 
@@ -670,12 +681,14 @@ def main():
     contents: List[Tuple[str, str, str]] = []  # (content, filestub, ref_code)
     map_rows: List[Dict[str, str]] = []
 
+    zip_cols = resolve_zip_columns(rows[0].keys())
+    letter_cols = resolve_letter_columns(rows[0].keys())
     for i, row in enumerate(rows, start=1):
-        z5 = get_zip_from_row_generic(row) or ""
+        z5 = get_zip_from_row_generic(row, zip_cols) or ""
         zips.append(z5)
 
         content, filestub, owner_display, prop_address = personalize_letter(
-            row, args.name, args.phone, args.email, template_text
+            row, args.name, args.phone, args.email, template_text, letter_cols
         )
         ref_code = generate_ref_code()
         contents.append((content, filestub, ref_code))
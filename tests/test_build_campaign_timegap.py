@@ -0,0 +1,178 @@
+import csv, datetime, os, pickle, random, sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import build_campaign_timegap as bct
+
+TRACKER_HEADERS = ["PropertyAddress","OwnerName","CampaignCount","CampaignNumbers","LastSentDt"]
+
+def _write_tracker(path: Path, rows):
+    with path.open("w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(TRACKER_HEADERS)
+        w.writerows(rows)
+
+# ----------------- Tracker cache -----------------
+def _tracker_env(tmp_path: Path, monkeypatch):
+    tracker = tmp_path / "tracker.csv"
+    _write_tracker(tracker, [["1 MAIN ST","DOE JANE","2","1|3","03/04/2025"]])
+    monkeypatch.setattr(bct, "TRACKER_FILE", str(tracker))
+    monkeypatch.setattr(bct, "TRACKER_CACHE_DIR", str(tmp_path / "cache"))
+    parses = []
+    real_iter = bct._iter_records
+    def counting_iter(r, headers):
+        parses.append(1)
+        return real_iter(r, headers)
+    monkeypatch.setattr(bct, "_iter_records", counting_iter)
+    return tracker, parses
+
+KEY = bct.norm_key("1 MAIN ST", "DOE JANE")
+
+def test_tracker_cache_hit(tmp_path: Path, monkeypatch):
+    _, parses = _tracker_env(tmp_path, monkeypatch)
+    first = bct.read_tracker()
+    second = bct.read_tracker()
+    assert len(parses) == 1, "second load should come from the cache"
+    assert second == first
+    assert second[KEY] == bct.TrackerEntry(2, 3, datetime.date(2025, 3, 4))
+    assert isinstance(second[KEY], bct.TrackerEntry)
+    # Stored as plain tuples so any caller (script or importer) can load it
+    with open(bct._tracker_cache_path(), "rb") as f:
+        _, _, _, stored = pickle.load(f)
+    assert type(stored[KEY]) is tuple
+
+def test_tracker_cache_miss_after_size_or_mtime_change(tmp_path: Path, monkeypatch):
+    tracker, parses = _tracker_env(tmp_path, monkeypatch)
+    bct.read_tracker()
+    # Content (and size) change
+    _write_tracker(tracker, [["1 MAIN ST","DOE JANE","3","1|3|5","04/05/2025"]])
+    assert bct.read_tracker()[KEY] == bct.TrackerEntry(3, 5, datetime.date(2025, 4, 5))
+    assert len(parses) == 2
+    # Same bytes, new mtime
+    st = os.stat(tracker)
+    os.utime(tracker, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    bct.read_tracker()
+    assert len(parses) == 3
+
+def test_tracker_cache_dateless_upgraded_for_time_filters(tmp_path: Path, monkeypatch):
+    _, parses = _tracker_env(tmp_path, monkeypatch)
+    assert bct.read_tracker(with_dates=False)[KEY].last_sent is None
+    dated = bct.read_tracker(with_dates=True)
+    assert len(parses) == 2, "a dateless cache must not serve a dated load"
+    assert dated[KEY].last_sent == datetime.date(2025, 3, 4)
+    # The dated cache now serves both kinds of load
+    bct.read_tracker(with_dates=False)
+    bct.read_tracker(with_dates=True)
+    assert len(parses) == 2
+
+def test_tracker_cache_unreadable_or_old_version_falls_back(tmp_path: Path, monkeypatch):
+    tracker, parses = _tracker_env(tmp_path, monkeypatch)
+    os.makedirs(bct.TRACKER_CACHE_DIR)
+    path = bct._tracker_cache_path()
+    with open(path, "wb") as f:
+        f.write(b"not a pickle")
+    assert bct.read_tracker()[KEY].count == 2
+    assert len(parses) == 1
+
+    st = os.stat(tracker)
+    old_tag = (bct.TRACKER_CACHE_VERSION - 1,) + bct._tracker_cache_tag()[1:]
+    with open(path, "wb") as f:
+        pickle.dump((old_tag, (st.st_mtime_ns, st.st_size), True, {KEY: (99, 99, None)}), f)
+    assert bct.read_tracker()[KEY].count == 2
+    assert len(parses) == 2
+
+# ----------------- End-to-end builds -----------------
+LIST_HEADERS = ["Property Address","Primary Name","MAILING ADDRESS","MAIL ZIP"]
+
+def _write_lists(base: Path, zip_sizes, seed: int = 0, shares=(0.6, 0.6, 0.6)):
+    """Three source lists drawn from one pool of rows (so they overlap), plus a small tracker.
+    shares[i] is the chance a pool row lands in list i; L0 is the mandatory one."""
+    rng = random.Random(seed)
+    pool = []
+    for z5, n in zip_sizes.items():
+        for i in range(n):
+            addr = f"{i + 1} {rng.choice(['OAK','PINE','MAIN','ELM'])} {rng.choice(['ST','AVE','DR'])}"
+            owner = f"{rng.choice(['SMITH','DOE','LEE','GARCIA'])} {rng.choice(['JOHN','MARY','ANA'])} {z5}-{i}"
+            pool.append([addr, owner, f"{addr}, TOWN, CA {z5}", z5])
+    (base / "PropertyLists").mkdir(parents=True, exist_ok=True)
+    for name, share in zip(("L0.csv","L1.csv","L2.csv"), shares):
+        with (base / "PropertyLists" / name).open("w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f)
+            w.writerow(LIST_HEADERS)
+            w.writerows(r for r in pool if rng.random() < share)
+    (base / "MasterCampaignTracker").mkdir(exist_ok=True)
+    _write_tracker(base / "MasterCampaignTracker" / "MasterPropertyCampaignTracker.csv",
+                   [[r[2], r[1], "1", "3", "01/02/2025"] for r in pool[::7]])  # MAILING ADDRESS outranks Property Address in ADDR_COLS
+
+def _build(cwd: Path, monkeypatch, *args) -> Path:
+    """Run the builder's main() in cwd and return the campaign folder it created."""
+    monkeypatch.chdir(cwd)
+    monkeypatch.setattr(bct, "TRACKER_CACHE_DIR", str(cwd / "cache"))
+    monkeypatch.setattr(sys, "argv", ["build_campaign_timegap.py", "--campaign-name", "C", "--campaign-number", "5",
+                                      "--mandatory", "PropertyLists/L0.csv",
+                                      "--optional", "PropertyLists/L1.csv", "PropertyLists/L2.csv", *args])
+    bct.main()
+    (camp,) = cwd.glob("C_5_*")
+    return camp
+
+OUTPUTS = ("campaign_master.csv","presort_report.csv","presort_zip3_summary.csv","postage_estimate.csv")
+
+def test_workers_output_identical_to_serial(tmp_path: Path, monkeypatch, capsys):
+    # The pool is capped at os.cpu_count(); pretend there are enough cores so --workers 2 really forks
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    zips = {"95746": 400, "95747": 160, "95835": 90, "91117": 30}
+    outs = {}
+    for workers in ("1", "2"):
+        base = tmp_path / f"w{workers}"
+        _write_lists(base, zips)
+        camp = _build(base, monkeypatch, "--target-size", "500", "--strict-150", "--seed", "7",
+                      "--prior-max", "0", "--workers", workers, "--debug")
+        log = capsys.readouterr().out
+        assert f"(workers={workers})" in log
+        assert "dropped_prior=0  " not in log.split("MAND kept=")[1].split("\n")[0], "tracker should drop some rows"
+        outs[workers] = {name: (camp / name).read_bytes() for name in OUTPUTS}
+    assert outs["1"] == outs["2"]
+
+def test_same_seed_same_master(tmp_path: Path, monkeypatch):
+    zips = {"95746": 300, "95835": 120, "91117": 40}
+    masters = []
+    for run_dir in ("a", "b"):
+        base = tmp_path / run_dir
+        _write_lists(base, zips)
+        camp = _build(base, monkeypatch, "--target-size", "400", "--seed", "11")
+        masters.append((camp / "campaign_master.csv").read_bytes())
+    assert masters[0] == masters[1]
+
+def _read_rows(path: Path):
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f))[1:]
+
+def _uncapped_reports(base: Path, target: int, strict_150: bool):
+    """presort ZIP5 counts and postage rows from a pick over every candidate (no reservoir cap)."""
+    seen, by_zip5 = set(), {}
+    for name in ("L0.csv","L1.csv","L2.csv"):
+        for k, addr, own, z5, r in bct.filter_source_file(str(base / "PropertyLists" / name), None).kept:
+            if k not in seen:
+                seen.add(k)
+                by_zip5.setdefault(z5, []).append(bct.Cand(addr, own, z5, r, []))
+    chosen = bct.pick_optimized(by_zip5, target, strict_150, random.Random(0))
+    counts = {}
+    for c in chosen:
+        counts[c.zip5] = counts.get(c.zip5, 0) + 1
+    est = bct.estimate_postage(counts, 0.1, 0.2, 0.3)
+    return counts, [est["five_digit"], est["three_digit"], est["aadc"], round(est["total_cost"], 2)]
+
+def test_capped_reservoirs_match_uncapped_pick(tmp_path: Path, monkeypatch):
+    # Target 400 caps each reservoir at 450; both large ZIP5s overflow it, and the smaller
+    # one is seen first, so ordering must follow the true ZIP5 sizes, not the capped ones.
+    zips = {"95747": 700, "95746": 1000, "95835": 160, "91117": 50}
+    for strict in (True, False):
+        base = tmp_path / ("strict" if strict else "loose")
+        _write_lists(base, zips, shares=(0.05, 0.6, 0.6))
+        camp = _build(base, monkeypatch, "--target-size", "400", "--seed", "3",
+                      "--rate-5digit", "0.1", "--rate-3digit", "0.2", "--rate-aadc", "0.3",
+                      *(["--strict-150"] if strict else []))
+        counts, postage = _uncapped_reports(base, 400, strict)
+        assert {z: int(c) for z, c in _read_rows(camp / "presort_report.csv")} == counts
+        got = {r[0]: r for r in _read_rows(camp / "postage_estimate.csv")}
+        assert [int(got["5digit"][1]), int(got["3digit"][1]), int(got["AADC"][1]), float(got["total"][3])] == postage